@@ -1,9 +1,10 @@
 import re
 from datetime import datetime, time, date
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Iterable, Union
 
 from scrapy.http import HtmlResponse
-from lxml.html import fromstring, HtmlElement
+from lxml.etree import XPath
+from lxml.html import fromstring, HtmlElement, HTMLParser
 from city_scrapers_core.constants import (
     BOARD,
     FORUM,
@@ -21,8 +22,38 @@ from logging import Logger
 
 log: Logger = logging.getLogger("alle_library_assoc")
 
+# A single parser is reused for every response. The site is served as UTF-8 so
+# the raw body can be handed to lxml without decoding it to a str first.
+_HTML_PARSER = HTMLParser(encoding="utf-8", recover=True)
+
+# Every meeting is currently remote so they can all share this one location.
+# Nothing downstream mutates it.
+_REMOTE_LOCATION: Dict[str, str] = {"name": "Remote", "address": "Remote"}
+
+# Keys are casefolded so lookups stay case-insensitive like strptime's %B was
+_MONTHS: Dict[str, int] = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+_WEEKDAYS = frozenset(
+    ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+)
+
 
 class MeetingTimes:
+    __slots__ = ("board", "general", "advisory", "lac")
+
     board: time
     general: time
     advisory: time
@@ -36,6 +67,8 @@ class MeetingTimes:
 
 
 class MeetingDate:
+    __slots__ = ("the_date", "the_place", "notes")
+
     the_date: date
     the_place: Dict[str, str]
     notes: Optional[str]
@@ -47,6 +80,8 @@ class MeetingDate:
 
 
 class AllGenericInfo:
+    __slots__ = ("the_date", "location", "status", "notes", "source")
+
     the_date: datetime
     location: Dict[str, str]
     status: Union[CANCELLED, CONFIRMED, PASSED]
@@ -84,51 +119,93 @@ class AlleLibraryAssocSpider(CityScrapersSpider):
     # - Monday, January 27 - some note
     # - Monday, January 27 some note
     #
-    # This regex is a little complicated BUT FOR GOOD REASON
-    # - \s+ is used a lot instead of a simple space because the page has random
-    #   weird whitespace characters instead of normal spaces
-    # - This clause '(\s+[–-]\s+|\s+)' is here because notes show up either like
-    #   'Mon, Jan 27 - note here' or 'Mon, Jan 27 note here'.
-    # - You'll notice I have '[–-]'. I inside the brackets are a minus and an
-    #   endash (I think). The website was using endashes and my tests used
-    #   minuses so I figure I'd include both.
-    date_reg = re.compile(r"(\w+,\s+\w+\s+\d+)((\s+[–-]\s+|\s+)(.*))?")
+    # The page has random weird whitespace characters instead of normal spaces.
+    # Rather than handling that in date_reg, _date_from_lis collapses every run
+    # of whitespace into one plain space before matching the date, which keeps
+    # date_reg a simple ASCII match. The last group is only there to tell
+    # whether a space (and so some notes) follows the day.
+    #
+    # The notes are taken from the original text so they show up exactly as
+    # written on the page. notes_reg is here because notes show up either like
+    # 'Mon, Jan 27 - note here' or 'Mon, Jan 27 note here'. You'll notice I
+    # have '[–-]'. I inside the brackets are a minus and an endash (I think).
+    # The website was using endashes and my tests used minuses so I figure I'd
+    # include both.
+    date_reg = re.compile(r"([A-Za-z]+), ([A-Za-z]+) (\d{1,2})(?!\d)( )?")
+    notes_reg = re.compile(r"(?:[–-]\s+)?(.*)")
+
+    # XPath expressions are compiled once here instead of being reparsed by
+    # lxml every time the page is scraped.
+    _XP_BOARD_DIV = XPath("//div/h2[text()='Board']/..")
+    _XP_UL = XPath("ul")
+    _XP_LAC_UL = XPath("./div/div/ul")
+    _XP_P = XPath("p")
+    _XP_LAC_P = XPath("./div/p")
+    _XP_LI = XPath("li")
+
+    # What the board, general, advisory, and lac paragraphs are expected to say
+    # and the times they translate to. See _ensure_times_are_as_expected.
+    _EXPECTED_PS = (
+        "ACLA Board meetings (6:30 pm unless otherwise noted)",
+        "General Membership meetings (7:00 pm)",
+        "(10:00 am)",
+        "(10:00 am)",
+    )
+    _MEETING_TIMES = MeetingTimes(
+        board=time(18, 30), general=time(19, 0), advisory=time(10, 0), lac=time(10, 0),
+    )
+
+    # Every meeting is assumed to be remote (see _REMOTE_LOCATION). If this
+    # statement ever disappears from the page that assumption needs revisiting.
+    _REMOTE_STATEMENT = b"All meetings will be held remotely until further notice"
 
     def parse(self, response: HtmlResponse):
-        tree = fromstring(response.text)
+        # A plain substring search on the raw body is enough for this check and
+        # is much cheaper than digging the statement out of the tree
+        if self._REMOTE_STATEMENT not in response.body:
+            raise PageChangedException()
+
+        tree = fromstring(response.body, parser=_HTML_PARSER)
 
         # I'm assuming the heading 'Board' doesn't show up in any other tab
-        board_div = tree.xpath("//div/h2[text()='Board']/..")
+        board_div = self._XP_BOARD_DIV(tree)
         if len(board_div) != 1:
             raise PageChangedException()
         board_div = board_div[0]
 
+        # Grab the year once so every date on the page agrees on it
+        current_year = date.today().year
+
         meeting_times = self._ensure_times_are_as_expected(board_div)
-        self._ensure_meetings_are_remote(board_div)
-        dates = self._get_dates(board_div)
+        dates = self._get_dates(board_div, current_year)
         board_dates, general_dates, advisory_dates, lac_dates = dates
-        meetings = self._make_meeting(
+        meetings = []
+        self._emit_meetings(
+            meetings,
             board_dates,
             meeting_times.board,
             "alle_library_assoc_board_",
             "Board Meeting",
             BOARD,
         )
-        meetings += self._make_meeting(
+        self._emit_meetings(
+            meetings,
             general_dates,
             meeting_times.general,
             "alle_library_assoc_general_",
             "General Meeting",
             FORUM,
         )
-        meetings += self._make_meeting(
+        self._emit_meetings(
+            meetings,
             advisory_dates,
             meeting_times.advisory,
             "alle_library_assoc_advisory_",
             "Advisory Council Meeting",
             ADVISORY_COMMITTEE,
         )
-        meetings += self._make_meeting(
+        self._emit_meetings(
+            meetings,
             lac_dates,
             meeting_times.lac,
             "alle_library_assoc_lac_",
@@ -146,12 +223,29 @@ class AlleLibraryAssocSpider(CityScrapersSpider):
         classification,
     ) -> List[Meeting]:
         meetings = []
+        self._emit_meetings(
+            meetings, dates, meeting_time, id_prefix, title, classification
+        )
+        return meetings
+
+    def _emit_meetings(
+        self,
+        out: List[Meeting],
+        dates: List[MeetingDate],
+        meeting_time: time,
+        id_prefix: str,
+        title: str,
+        classification,
+    ):
+        """Make a meeting for each date and append them to out."""
+        # Use the same "now" for every meeting in the batch
+        now = datetime.now()
         for the_date in dates:
             start = datetime.combine(the_date.the_date, meeting_time)
-            the_id = f"{id_prefix}_{start.strftime(r'%Y_%m_%d')}"
+            the_id = f"{id_prefix}_{start.year:04d}_{start.month:02d}_{start.day:02d}"
             if the_date.notes and "canceled" in the_date.notes.casefold():
                 status = CANCELLED
-            elif start < datetime.now():
+            elif start < now:
                 status = PASSED
             else:
                 status = CONFIRMED
@@ -166,53 +260,64 @@ class AlleLibraryAssocSpider(CityScrapersSpider):
                 source=self.start_urls[0],
                 start=start,
             )
-            meetings.append(meeting)
-        return meetings
+            out.append(meeting)
 
-    def _date_from_lis(self, lis: List[str]) -> List[MeetingDate]:
-        location = {"name": "Remote", "address": "Remote"}
+    def _date_from_lis(self, lis: Iterable[str], year: int) -> List[MeetingDate]:
         dates = []
+        match_date = self.date_reg.match
         for li in lis:
-            log.info(repr(li))
-            match = self.date_reg.match(li)
+            log.debug("li text: %r", li)
+            match = match_date(" ".join(li.split()))
             if not match:
                 log.warning("Failed to capture a meeting date.")
                 continue
 
-            # Take 'Monday, January 27' and turn it into a date
-            date_str = match.group(1).strip()
-            tmp_date = datetime.strptime(date_str, r"%A, %B %d")
-            the_date = date(date.today().year, tmp_date.month, tmp_date.day)
+            # Take 'Monday, January 27' and turn it into a date. Looking the
+            # names up directly is much cheaper than strptime.
+            weekday, month_name, day, notes_follow = match.groups()
+            month = _MONTHS.get(month_name.casefold())
+            if month is None or weekday.casefold() not in _WEEKDAYS:
+                log.warning("Failed to capture a meeting date.")
+                continue
+            try:
+                the_date = date(year, month, int(day))
+            except ValueError:
+                # Day doesn't exist in that month
+                log.warning("Failed to capture a meeting date.")
+                continue
 
-            notes = match.group(4).strip() if match.group(4) else None
-            dates.append(MeetingDate(the_date, location, notes))
+            # The date is the first three words so when a space follows the
+            # day everything after those words is the notes
+            notes = None
+            if notes_follow:
+                notes_raw = li.split(None, 3)[3]
+                notes = self.notes_reg.match(notes_raw).group(1).strip() or None
+
+            dates.append(MeetingDate(the_date, _REMOTE_LOCATION, notes))
         return dates
 
-    def _lis_from_ul(self, some_ul: HtmlElement) -> List[str]:
-        return [li.text_content().strip() for li in some_ul.xpath("li")]
+    def _date_from_ul(self, some_ul: HtmlElement, year: int) -> List[MeetingDate]:
+        # The li text is fed through a generator so the lis are only walked once
+        lis = (li.text_content() for li in self._XP_LI(some_ul))
+        return self._date_from_lis(lis, year)
 
-    def _get_dates(self, board_div: HtmlElement):
+    def _get_dates(self, board_div: HtmlElement, year: int):
         """Get the lists of dates, locations, and notes from the website."""
         # I expect there to be two uls. The first with the board dates and the
         # second with the general membership dates
-        uls = board_div.xpath("ul")
+        uls = self._XP_UL(board_div)
         if len(uls) != 3:
             raise PageChangedException()
         board_ul, general_ul, advisory_ul = uls
-        lac_uls = board_div.xpath("./div/div/ul")
+        lac_uls = self._XP_LAC_UL(board_div)
         if len(lac_uls) != 1:
             raise PageChangedException()
         lac_ul = lac_uls[0]
 
-        board_lis = self._lis_from_ul(board_ul)
-        general_lis = self._lis_from_ul(general_ul)
-        advisory_lis = self._lis_from_ul(advisory_ul)
-        lac_lis = self._lis_from_ul(lac_ul)
-
-        board_dates = self._date_from_lis(board_lis)
-        general_dates = self._date_from_lis(general_lis)
-        advisory_dates = self._date_from_lis(advisory_lis)
-        lac_dates = self._date_from_lis(lac_lis)
+        board_dates = self._date_from_ul(board_ul, year)
+        general_dates = self._date_from_ul(general_ul, year)
+        advisory_dates = self._date_from_ul(advisory_ul, year)
+        lac_dates = self._date_from_ul(lac_ul, year)
         return (board_dates, general_dates, advisory_dates, lac_dates)
 
     def _ensure_times_are_as_expected(self, board_div: HtmlElement) -> MeetingTimes:
@@ -229,42 +334,19 @@ class AlleLibraryAssocSpider(CityScrapersSpider):
         # function.  I'm assuming the first p is for the board and the second p
         # is general
 
-        expected_board_p = "ACLA Board meetings (6:30 pm unless otherwise noted)"
-        expected_general_p = "General Membership meetings (7:00 pm)"
-        expected_advisory_p = "(10:00 am)"
-        expected_lac_p = "(10:00 am)"
-
-        ps = board_div.xpath("p")
+        ps = self._XP_P(board_div)
         if len(ps) != 3:
             raise PageChangedException()
         board_p, general_p, advisory_p = ps
-        lac_ps = board_div.xpath("./div/p")
+        lac_ps = self._XP_LAC_P(board_div)
         if len(lac_ps) < 2:
             raise PageChangedException()
         lac_p = lac_ps[0]
 
-        if board_p.text_content().strip() != expected_board_p:
-            raise PageChangedException()
-        if general_p.text_content().strip() != expected_general_p:
-            raise PageChangedException()
-        if advisory_p.text_content().strip() != expected_advisory_p:
-            raise PageChangedException()
-        if lac_p.text_content().strip() != expected_lac_p:
-            raise PageChangedException()
-
-        return MeetingTimes(
-            board=time(18, 30),
-            general=time(19, 0),
-            advisory=time(10, 0),
-            lac=time(10, 0),
+        actual = tuple(
+            p.text_content().strip() for p in (board_p, general_p, advisory_p, lac_p)
         )
-
-    def _ensure_meetings_are_remote(self, board_div: HtmlElement):
-        remote_statement_p = board_div.xpath("./div/div/p")
-        if len(remote_statement_p) != 1:
+        if actual != self._EXPECTED_PS:
             raise PageChangedException()
-        remote_statement_p = remote_statement_p[0]
 
-        statement = "All meetings will be held remotely until further notice"
-        if statement not in remote_statement_p.text_content():
-            raise PageChangedException()
+        return self._MEETING_TIMES
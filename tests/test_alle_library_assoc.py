@@ -6,7 +6,6 @@ from typing import Optional
 from city_scrapers_core.constants import BOARD, CANCELLED, CONFIRMED, PASSED
 from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
-from pytest import raises
 
 from city_scrapers.spiders.alle_library_assoc import (
     AlleLibraryAssocSpider,
@@ -165,7 +164,7 @@ def test_date_from_lis():
 
     def compare_singles(the_date: date, note: Optional[str], date_str: str):
         meeting_correct = MeetingDate(the_date, {}, note)
-        meeting_result = spider._date_from_lis([date_str])
+        meeting_result = spider._date_from_lis([date_str], 2021)
         assert len(meeting_result) == 1
         compare_meetings(meeting_correct, meeting_result[0])
 
@@ -175,8 +174,16 @@ def test_date_from_lis():
     compare_singles(jan_27, None, "Monday, January 27")
 
     # Month and day don't match
-    with raises(Exception):
-        spider._date_from_lis(["Tuesday, February 30"])
+    assert spider._date_from_lis(["Tuesday, February 30"], 2021) == []
+
+    # Day and month names aren't case sensitive
+    compare_singles(jan_27, None, "Monday, JANUARY 27")
+    compare_singles(jan_27, None, "monday, january 27")
+
+    # Unknown weekdays or months and malformed days are skipped
+    assert spider._date_from_lis(["Monday, Janvier 27"], 2021) == []
+    assert spider._date_from_lis(["Funday, January 27"], 2021) == []
+    assert spider._date_from_lis(["Monday, January 027"], 2021) == []
 
     # Test out notes normal
     compare_singles(jan_27, "note", "Monday, January 27 - note")
@@ -188,6 +195,15 @@ def test_date_from_lis():
         jan_27, "note - other - note", "Monday, January 27 - note - other - note",
     )
 
+    # Notes are kept exactly as written
+    compare_singles(jan_27, "1–2 pm", "Monday, January 27 – 1–2 pm")
+    compare_singles(jan_27, "a  b\u00A0c", "Monday, January 27 - a  b\u00A0c")
+
+    # Anything glued to the day isn't a note
+    compare_singles(jan_27, None, "Monday, January 27, 2021")
+    compare_singles(jan_27, None, "Monday, January 27:30 pm note")
+    compare_singles(jan_27, None, "Monday, January 27 - ")
+
     # Test out different spaces
     # \u00A0 has showed up before. The rest are just... yeah
     spaces = ["\u2003", "\u2004", "\u2008", "\u00A0", "\t", " "]